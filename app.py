@@ -1,18 +1,41 @@
 import streamlit as st
 import tempfile
 import os
+import re
+import shutil
+import hashlib
+import threading
 from pathlib import Path
 import time
 from datetime import datetime
 from codescan import CodeAnalyzer
 from utils import display_code_with_highlights, create_file_tree
 from styles import apply_custom_styles
-import base64
-import plotly.express as px
-import plotly.graph_objects as go
-from collections import Counter
-import pandas as pd
-import zipfile
+from collections import Counter, defaultdict
+from functools import lru_cache
+
+# Chart category limits; beyond these the browser-side render becomes the bottleneck
+PIE_SLICE_LIMIT = 30
+PIE_TOP_SLICES = 25
+CORRELATION_FILE_LIMIT = 50
+
+# Cached repository scans each hold a full result set, so only a few are kept, for an hour
+SCAN_CACHE_MAX_ENTRIES = 8
+SCAN_CACHE_TTL = 3600
+
+# Download bytes are cached per file and mtime; old reports drop out instead of piling up
+DOWNLOAD_CACHE_MAX_ENTRIES = 16
+DOWNLOAD_CACHE_TTL = 3600
+
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Source file types the analyzer understands; ZIP uploads are extracted down to these
+CODE_FILE_EXTENSIONS = ['py', 'java', 'js', 'ts', 'cs', 'php', 'rb', 'xsd']
+ZIP_SKIPPED_DIRS = {'__MACOSX', '.git'}
+
+# Trailing _YYYYMMDD_HHMMSS stamp in generated report filenames
+REPORT_TIMESTAMP_RE = re.compile(r'_(\d{8})_(\d{6})(?:\.[^._]*)?$')
 
 # Page config
 st.set_page_config(
@@ -31,51 +54,127 @@ st.sidebar.markdown("""
 **Zensar Project Diamond Team**
 """)
 
-def get_file_download_link(file_path):
-    """Generate a download link for a file"""
-    with open(file_path, 'r', encoding='utf-8-sig') as f:
-        data = f.read()
-    b64 = base64.b64encode(data.encode()).decode()
-    return f'<a href="data:text/html;base64,{b64}" download="{os.path.basename(file_path)}" class="download-button">Download</a>'
+def _remove_path(path):
+    """Delete a file or directory tree, ignoring anything already gone"""
+    if os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def remove_in_background(path):
+    """Delete a temporary file or directory without blocking the rerun"""
+    threading.Thread(target=_remove_path, args=(path,), daemon=True).start()
 
+@st.cache_data(show_spinner=False, max_entries=DOWNLOAD_CACHE_MAX_ENTRIES, ttl=DOWNLOAD_CACHE_TTL)
+def read_file_bytes(file_path, mtime):
+    """Read a file for download, memoized on its path and modification time"""
+    with open(file_path, 'rb') as f:
+        return f.read()
+
+@lru_cache(maxsize=4096)
 def parse_timestamp_from_filename(filename):
     """Extract timestamp from filename format app_name_code_analysis_YYYYMMDD_HHMMSS"""
+    # Date and time are the last two underscore-separated parts, before the extension
+    match = REPORT_TIMESTAMP_RE.search(filename)
+    if not match:
+        return datetime.min
+    date_part, time_part = match.groups()
     try:
-        # Extract date and time part
-        date_time_str = filename.split('_')[-2] + '_' + filename.split('_')[-1].split('.')[0]
-        return datetime.strptime(date_time_str, '%Y%m%d_%H%M%S')
-    except:
+        return datetime(
+            int(date_part[:4]), int(date_part[4:6]), int(date_part[6:8]),
+            int(time_part[:2]), int(time_part[2:4]), int(time_part[4:6])
+        )
+    except ValueError:
         return datetime.min
 
-def create_dashboard_charts(results):
+def compute_scan_fingerprint(file_paths):
+    """Hash the path, size and mtime of every file the scanner will read"""
+    # file_paths comes from CodeAnalyzer.get_code_files, so ignored directories, other
+    # file types and oversized files neither cost a stat nor invalidate the cache
+    digest = hashlib.blake2b(digest_size=16)
+    for file_path in sorted(file_paths):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            continue
+        digest.update(f"{file_path}\0{stat.st_size}\0{int(stat.st_mtime)}\n".encode('utf-8', 'surrogateescape'))
+    return digest.hexdigest()
+
+@st.cache_data(show_spinner=False, max_entries=SCAN_CACHE_MAX_ENTRIES, ttl=SCAN_CACHE_TTL)
+def run_cached_scan(repo_path, app_name, fingerprint):
+    """Run the repository scan, memoized on the repository fingerprint; the caller writes the report"""
+    return CodeAnalyzer(repo_path, app_name).scan_repository(write_report=False)
+
+def compute_file_basenames(results):
+    """Map every analyzed file path to its file name in one vectorized pass"""
+    import pandas as pd
+
+    paths = pd.Series([detail['file_path'] for detail in results['summary']['file_details']], dtype=object)
+    basenames = paths.str.rsplit(os.sep, n=1).str[-1]
+    return dict(zip(paths.values, basenames.values))
+
+def file_extension(file_path):
+    """Return the suffix of a file path, matching Path(file_path).suffix"""
+    name_start = max(file_path.rfind('/'), file_path.rfind(os.sep)) + 1
+    dot = file_path.rfind('.', name_start)
+    return file_path[dot:] if dot > name_start and dot < len(file_path) - 1 else ''
+
+def summary_metrics(results):
+    """Return the (files, demographic fields, integration patterns, unique fields) summary counts"""
+    summary = results['summary']
+    return (
+        summary['files_analyzed'],
+        summary['demographic_fields_found'],
+        summary['integration_patterns_found'],
+        len(summary['unique_demographic_fields'])
+    )
+
+def create_dashboard_charts(results, file_basenames):
     """Create visualization charts for the dashboard"""
+    import numpy as np
+    import pandas as pd
+    import plotly.express as px
+    import plotly.graph_objects as go
+
     # Summary Stats at the top
     st.subheader("Summary")
+    files_analyzed, demographic_fields, integration_patterns, unique_fields = summary_metrics(results)
     stats_cols = st.columns(4)
-    stats_cols[0].metric("Files Analyzed", results['summary']['files_analyzed'])
-    stats_cols[1].metric("Demographic Fields", results['summary']['demographic_fields_found'])
-    stats_cols[2].metric("Integration Patterns", results['summary']['integration_patterns_found'])
-    stats_cols[3].metric("Unique Fields", len(results['summary']['unique_demographic_fields']))
+    stats_cols[0].metric("Files Analyzed", files_analyzed)
+    stats_cols[1].metric("Demographic Fields", demographic_fields)
+    stats_cols[2].metric("Integration Patterns", integration_patterns)
+    stats_cols[3].metric("Unique Fields", unique_fields)
 
     st.markdown("----")  # Add a separator line
 
     # 1. Demographic Fields Distribution - Side by side charts
-    field_frequencies = {}
-    for file_data in results['demographic_data'].values():
-        for field_name, data in file_data.items():
-            if field_name not in field_frequencies:
-                field_frequencies[field_name] = len(data['occurrences'])
-            else:
-                field_frequencies[field_name] += len(data['occurrences'])
+    field_rows = [
+        (field_name, len(data['line_numbers']))
+        for file_data in results['demographic_data'].values()
+        for field_name, data in file_data.items()
+    ]
+    field_frequencies = pd.DataFrame(field_rows, columns=['field', 'count']).groupby('field', sort=False)['count'].sum()
 
     # Create two columns for side-by-side charts
     col1, col2 = st.columns(2)
 
+    # Collapse the long tail of rare fields into a single "Other" slice
+    pie_frequencies = field_frequencies
+    if len(field_frequencies) > PIE_SLICE_LIMIT:
+        ranked_fields = field_frequencies.sort_values(ascending=False, kind='stable')
+        pie_frequencies = pd.concat([
+            ranked_fields.iloc[:PIE_TOP_SLICES],
+            pd.Series({'Other': ranked_fields.iloc[PIE_TOP_SLICES:].sum()})
+        ])
+
     with col1:
         # Pie Chart
         fig_demo_pie = px.pie(
-            values=list(field_frequencies.values()),
-            names=list(field_frequencies.keys()),
+            values=pie_frequencies.values,
+            names=pie_frequencies.index,
             title="Distribution of Demographic Fields (Pie Chart)",
             color_discrete_sequence=px.colors.qualitative.Set3
         )
@@ -84,38 +183,42 @@ def create_dashboard_charts(results):
     with col2:
         # Bar Chart
         fig_demo_bar = px.bar(
-            x=list(field_frequencies.keys()),
-            y=list(field_frequencies.values()),
+            x=field_frequencies.index,
+            y=field_frequencies.values,
             title="Distribution of Demographic Fields (Bar Chart)",
             labels={'x': 'Field Name', 'y': 'Occurrences'},
-            color=list(field_frequencies.keys()),
+            color=field_frequencies.index,
             color_discrete_sequence=px.colors.qualitative.Set3
         )
         fig_demo_bar.update_layout(showlegend=False)
         st.plotly_chart(fig_demo_bar, use_container_width=True)
 
     # 2. Files by Language Bar Chart
-    file_extensions = [Path(file['file_path']).suffix for file in results['summary']['file_details']]
-    file_counts = Counter(file_extensions)
+    file_counts = Counter(file_extension(file['file_path']) for file in results['summary']['file_details'])
+    extension_names = np.array(list(file_counts.keys()), dtype=object)
+    extension_counts = np.fromiter(file_counts.values(), dtype=np.int64, count=len(file_counts))
 
     fig_files = px.bar(
-        x=list(file_counts.keys()),
-        y=list(file_counts.values()),
+        x=extension_names,
+        y=extension_counts,
         title="Files by Language",
         labels={'x': 'File Extension', 'y': 'Count'},
-        color=list(file_counts.keys()),
+        color=extension_names,
         color_discrete_sequence=px.colors.qualitative.Set3
     )
     fig_files.update_layout(showlegend=False)
     st.plotly_chart(fig_files)
 
     # 3. Integration Patterns Line Graph
-    pattern_types = Counter(pattern['pattern_type'] for pattern in results['integration_patterns'])
+    pattern_types = pd.Series(
+        [pattern['pattern_type'] for pattern in results['integration_patterns']],
+        dtype=object
+    ).value_counts(sort=False)
 
     fig_patterns = go.Figure()
-    fig_patterns.add_trace(go.Scatter(
-        x=list(pattern_types.keys()),
-        y=list(pattern_types.values()),
+    fig_patterns.add_trace(go.Scattergl(
+        x=pattern_types.index,
+        y=pattern_types.values,
         mode='lines+markers',
         name='Pattern Count',
         line=dict(color='#0066cc', width=2),
@@ -132,10 +235,23 @@ def create_dashboard_charts(results):
     # 4. Files and Fields Correlation
     fig_correlation = go.Figure()
 
-    # Extract data for each file
-    file_names = [os.path.basename(detail['file_path']) for detail in results['summary']['file_details']]
-    demographic_counts = [detail['demographic_fields_found'] for detail in results['summary']['file_details']]
-    integration_counts = [detail['integration_patterns_found'] for detail in results['summary']['file_details']]
+    # Extract data for each file, keeping only the busiest files on large scans
+    file_details = results['summary']['file_details']
+    hidden_files = max(len(file_details) - CORRELATION_FILE_LIMIT, 0)
+    if hidden_files:
+        file_details = sorted(
+            file_details,
+            key=lambda d: d['demographic_fields_found'] + d['integration_patterns_found'],
+            reverse=True
+        )[:CORRELATION_FILE_LIMIT]
+
+    file_names = np.array([file_basenames[detail['file_path']] for detail in file_details], dtype=object)
+    demographic_counts = np.fromiter(
+        (detail['demographic_fields_found'] for detail in file_details), dtype=np.int64, count=len(file_details)
+    )
+    integration_counts = np.fromiter(
+        (detail['integration_patterns_found'] for detail in file_details), dtype=np.int64, count=len(file_details)
+    )
 
     fig_correlation.add_trace(go.Bar(
         name='Demographic Fields',
@@ -156,8 +272,132 @@ def create_dashboard_charts(results):
         yaxis_title="Count",
         barmode='group'
     )
+    if hidden_files:
+        fig_correlation.add_annotation(
+            text=f"+{hidden_files} more files",
+            xref='paper', yref='paper',
+            x=1, y=1.08,
+            showarrow=False
+        )
     st.plotly_chart(fig_correlation)
 
+@st.fragment
+def render_dashboard_tab():
+    """Render the Dashboard tab from the stored analysis results"""
+    st.header("Analysis Dashboard")
+    st.markdown("""
+    This dashboard provides visual insights into the code analysis results,
+    showing distributions of files, demographic fields, and integration patterns.
+    """)
+    create_dashboard_charts(st.session_state['results'], st.session_state['file_basenames'])
+
+@st.fragment
+def render_results_tab():
+    """Render the Analysis Results tab from the stored analysis results"""
+    import pandas as pd
+
+    results = st.session_state['results']
+    file_basenames = st.session_state['file_basenames']
+
+    # Summary Stats (full metrics are on the Dashboard tab)
+    files_analyzed, demographic_fields, integration_patterns, unique_fields = summary_metrics(results)
+    st.caption(
+        f"Files Analyzed: {files_analyzed} | Demographic Fields: {demographic_fields} | "
+        f"Integration Patterns: {integration_patterns} | Unique Fields: {unique_fields}"
+    )
+
+    # Demographic Fields Summary Table
+    st.subheader("Demographic Fields Summary")
+    demographic_files = [f for f in results['summary']['file_details'] if f['demographic_fields_found'] > 0]
+    if demographic_files:
+        demographic_table = pd.DataFrame([
+            {
+                '#': idx,
+                'File Analyzed': file_basenames[file_detail['file_path']],
+                'Fields Found': file_detail['demographic_fields_found'],
+                'Fields': ', '.join(results['demographic_data'].get(file_detail['file_path'], {}).keys())
+            }
+            for idx, file_detail in enumerate(demographic_files, 1)
+        ])
+        st.dataframe(demographic_table, hide_index=True, use_container_width=True)
+
+    # Integration Patterns Summary Table
+    st.subheader("Integration Patterns Summary")
+    integration_files = [f for f in results['summary']['file_details'] if f['integration_patterns_found'] > 0]
+    if integration_files:
+        patterns_by_file = defaultdict(set)
+        for pattern in results['integration_patterns']:
+            patterns_by_file[pattern['file_path']].add(f"{pattern['pattern_type']}: {pattern['sub_type']}")
+
+        integration_table = pd.DataFrame([
+            {
+                '#': idx,
+                'File Name': file_basenames[file_detail['file_path']],
+                'Patterns Found': file_detail['integration_patterns_found'],
+                'Pattern Details': ', '.join(patterns_by_file[file_detail['file_path']])
+            }
+            for idx, file_detail in enumerate(integration_files, 1)
+        ])
+        st.dataframe(integration_table, hide_index=True, use_container_width=True)
+
+@st.fragment
+def render_reports_tab():
+    """Render the Export Reports tab for the application that was analyzed"""
+    app_name = st.session_state['app_name']
+
+    st.header("Available Reports")
+
+    # Get all report files and filter by app_name
+    with os.scandir('.') as it:
+        report_files = [
+            entry.name for entry in it
+            if entry.name.startswith(app_name)
+            and entry.name.endswith('.html')
+            and 'CodeLens' in entry.name
+            and entry.is_file()
+        ]
+
+    # Parse each timestamp once and sort by it in descending order
+    reports = [(parse_timestamp_from_filename(f), f) for f in report_files]
+    reports.sort(reverse=True)
+
+    if reports:
+        # Create a table with five columns
+        cols = st.columns([1, 3, 2, 2, 2])
+        cols[0].markdown("**S.No**")
+        cols[1].markdown("**File Name**")
+        cols[2].markdown("**Date**")
+        cols[3].markdown("**Time**")
+        cols[4].markdown("**Download**")
+
+        # List all reports
+        for idx, (timestamp, report_file) in enumerate(reports, 1):
+            cols = st.columns([1, 3, 2, 2, 2])
+
+            # Serial number column
+            cols[0].text(f"{idx}")
+
+            # File name column without .html extension
+            display_name = report_file.replace('.html', '')
+            cols[1].text(display_name)
+
+            # Format date and time separately
+            # Date in DD-MMM-YYYY format
+            cols[2].text(timestamp.strftime('%d-%b-%Y'))
+            # Time in 12-hour format with AM/PM
+            cols[3].text(timestamp.strftime('%I:%M:%S %p'))
+
+            # Download button column (last)
+            cols[4].download_button(
+                "Download",
+                read_file_bytes(report_file, os.path.getmtime(report_file)),
+                file_name=report_file,
+                mime="text/html",
+                key=f"dl_{idx}"
+            )
+    else:
+        st.info("No reports available for this application.")
+
 def main():
     st.title("🔍 CodeLens")
     st.markdown("### Code Analysis Utility")
@@ -190,13 +430,12 @@ def main():
         """)
 
         if os.path.exists('sample_demographic_data.xlsx'):
-            with open('sample_demographic_data.xlsx', 'rb') as f:
-                st.download_button(
-                    label="📥 Download Sample Excel Format",
-                    data=f.read(),
-                    file_name="sample_demographic_data.xlsx",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                )
+            st.download_button(
+                label="📥 Download Sample Excel Format",
+                data=read_file_bytes('sample_demographic_data.xlsx', os.path.getmtime('sample_demographic_data.xlsx')),
+                file_name="sample_demographic_data.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            )
         else:
             st.info("Sample file not found. Please create it first by running the application setup.")
 
@@ -213,11 +452,15 @@ def main():
         )
 
         if uploaded_excel and st.sidebar.button("Analyze Excel Data"):
+            temp_excel_path = None
             try:
-                # Save uploaded file temporarily
-                temp_excel_path = f"temp_{uploaded_excel.name}"
-                with open(temp_excel_path, 'wb') as f:
-                    f.write(uploaded_excel.getbuffer())
+                # Save uploaded file to a path unique to this run; pandas picks the engine by suffix
+                fd, temp_excel_path = tempfile.mkstemp(suffix=Path(uploaded_excel.name).suffix)
+                with os.fdopen(fd, 'wb') as f:
+                    uploaded_excel.seek(0)
+                    shutil.copyfileobj(uploaded_excel, f, length=UPLOAD_CHUNK_SIZE)
+
+                import pandas as pd
 
                 with st.spinner("Analyzing Excel demographic data..."):
                     analyzer = CodeAnalyzer(".", excel_app_name)
@@ -235,7 +478,8 @@ def main():
                         st.subheader("Sample Demographic Data")
                         # Display first 10 records as preview
                         sample_data = excel_results['demographic_data'][:10]
-                        df_sample = pd.DataFrame(sample_data)
+                        # Arrow-backed columns go to st.dataframe without a pandas -> Arrow conversion
+                        df_sample = pd.DataFrame(sample_data).convert_dtypes(dtype_backend='pyarrow')
                         st.dataframe(df_sample)
 
                         st.subheader("Exported Files")
@@ -246,12 +490,12 @@ def main():
                         st.warning("No demographic data found in the uploaded Excel file.")
 
                 # Clean up temp file
-                os.remove(temp_excel_path)
+                remove_in_background(temp_excel_path)
 
             except Exception as e:
                 st.error(f"Error analyzing Excel file: {str(e)}")
-                if os.path.exists(temp_excel_path):
-                    os.remove(temp_excel_path)
+                if temp_excel_path and os.path.exists(temp_excel_path):
+                    remove_in_background(temp_excel_path)
 
         return
 
@@ -306,7 +550,7 @@ def main():
             1. **Download/Clone** the project files to your local machine
             2. **Install Dependencies**:
                ```bash
-               pip install streamlit plotly pandas openpyxl pygments fuzzywuzzy python-levenshtein
+               pip install streamlit plotly pandas openpyxl pygments fuzzywuzzy python-levenshtein pyahocorasick hyperscan xlsxwriter
                ```
             3. **Run the Application**:
                ```bash
@@ -323,6 +567,9 @@ def main():
             - pygments - Code syntax highlighting
             - fuzzywuzzy - Fuzzy string matching
             - python-levenshtein - String distance calculations
+            - pyahocorasick - Fast multi-keyword matching (optional, speeds up scanning)
+            - hyperscan - Multi-pattern regex scanning (optional, speeds up scanning)
+            - xlsxwriter - Faster Excel export (optional, openpyxl is used without it)
 
             ### Quick Start Guide
             This application is designed to run seamlessly on any Python environment. Simply:
@@ -340,6 +587,9 @@ def main():
             - `pygments` - Code syntax highlighting
             - `fuzzywuzzy` - Fuzzy string matching
             - `python-levenshtein` - String distance calculations
+            - `pyahocorasick` - Fast multi-keyword matching (optional, speeds up scanning)
+            - `hyperscan` - Multi-pattern regex scanning (optional, speeds up scanning)
+            - `xlsxwriter` - Faster Excel export (optional, openpyxl is used without it)
             """)
 
         elif doc_section == "Features":
@@ -387,13 +637,12 @@ def main():
             st.markdown("---")
             st.subheader("📥 Download Documentation")
             try:
-                with open('README.md', 'rb') as f:
-                    st.download_button(
-                        label="Download Complete README.md",
-                        data=f.read(),
-                        file_name="CodeLens_README.md",
-                        mime="text/markdown"
-                    )
+                st.download_button(
+                    label="Download Complete README.md",
+                    data=read_file_bytes('README.md', os.path.getmtime('README.md')),
+                    file_name="CodeLens_README.md",
+                    mime="text/markdown"
+                )
             except FileNotFoundError:
                 st.info("README.md file not available for download")
         return
@@ -408,22 +657,36 @@ def main():
         uploaded_files = st.sidebar.file_uploader(
             "Upload Code Files or ZIP Folder",
             accept_multiple_files=True,
-            type=['py', 'java', 'js', 'ts', 'cs', 'php', 'rb', 'xsd', 'zip']
+            type=CODE_FILE_EXTENSIONS + ['zip']
         )
 
         if uploaded_files:
             temp_dir = tempfile.mkdtemp()
+            if any(uploaded_file.name.endswith('.zip') for uploaded_file in uploaded_files):
+                import zipfile
+
             for uploaded_file in uploaded_files:
                 if uploaded_file.name.endswith('.zip'):
                     # Handle ZIP file extraction
-                    import zipfile
                     zip_path = os.path.join(temp_dir, uploaded_file.name)
                     with open(zip_path, 'wb') as f:
-                        f.write(uploaded_file.getbuffer())
+                        uploaded_file.seek(0)
+                        shutil.copyfileobj(uploaded_file, f, length=UPLOAD_CHUNK_SIZE)
 
-                    # Extract ZIP contents
+                    # Extract only analyzable source files, never outside temp_dir
+                    allowed_suffixes = {f'.{ext}' for ext in CODE_FILE_EXTENSIONS}
+                    extract_root = os.path.realpath(temp_dir)
                     with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                        zip_ref.extractall(temp_dir)
+                        for info in zip_ref.infolist():
+                            member = Path(info.filename)
+                            if info.is_dir() or member.suffix.lower() not in allowed_suffixes:
+                                continue
+                            if ZIP_SKIPPED_DIRS.intersection(member.parts):
+                                continue
+                            target = os.path.realpath(os.path.join(extract_root, info.filename))
+                            if not target.startswith(extract_root + os.sep):
+                                continue
+                            zip_ref.extract(info, temp_dir)
 
                     # Remove the ZIP file after extraction
                     os.remove(zip_path)
@@ -431,7 +694,8 @@ def main():
                     # Handle regular files
                     file_path = os.path.join(temp_dir, uploaded_file.name)
                     with open(file_path, 'wb') as f:
-                        f.write(uploaded_file.getbuffer())
+                        uploaded_file.seek(0)
+                        shutil.copyfileobj(uploaded_file, f, length=UPLOAD_CHUNK_SIZE)
 
             if st.sidebar.button("Run Analysis"):
                 analysis_triggered = True
@@ -445,134 +709,46 @@ def main():
     if analysis_triggered:
         try:
             with st.spinner("Analyzing code..."):
-                analyzer = CodeAnalyzer(repo_path, app_name)
                 progress_bar = st.progress(0)
 
-                # Run analysis
-                results = analyzer.scan_repository()
+                # Run analysis (cached while the repository contents are unchanged);
+                # uploads land in a fresh temporary directory, so they would never hit the cache
+                if temp_dir:
+                    results = CodeAnalyzer(repo_path, app_name).scan_repository()
+                else:
+                    analyzer = CodeAnalyzer(repo_path, app_name)
+                    fingerprint = compute_scan_fingerprint(analyzer.get_code_files())
+                    results = run_cached_scan(repo_path, app_name, fingerprint)
+                    # Every run writes its report, including runs served from the cache
+                    analyzer.write_html_report(results)
                 progress_bar.progress(100)
 
-                # Create tabs for Dashboard, Analysis Results, and Export Reports
-                tab1, tab2, tab3 = st.tabs(["Dashboard", "Analysis Results", "Export Reports"])
-
-                with tab1:
-                    st.header("Analysis Dashboard")
-                    st.markdown("""
-                    This dashboard provides visual insights into the code analysis results,
-                    showing distributions of files, demographic fields, and integration patterns.
-                    """)
-                    create_dashboard_charts(results)
-
-                with tab2:
-                    # Summary Stats
-                    st.subheader("Summary")
-                    stats_cols = st.columns(4)
-                    stats_cols[0].metric("Files Analyzed", results['summary']['files_analyzed'])
-                    stats_cols[1].metric("Demographic Fields", results['summary']['demographic_fields_found'])
-                    stats_cols[2].metric("Integration Patterns", results['summary']['integration_patterns_found'])
-                    stats_cols[3].metric("Unique Fields", len(results['summary']['unique_demographic_fields']))
-
-                    # Demographic Fields Summary Table
-                    st.subheader("Demographic Fields Summary")
-                    demographic_files = [f for f in results['summary']['file_details'] if f['demographic_fields_found'] > 0]
-                    if demographic_files:
-                        cols = st.columns([0.5, 2, 1, 2])
-                        cols[0].markdown("**#**")
-                        cols[1].markdown("**File Analyzed**")
-                        cols[2].markdown("**Fields Found**")
-                        cols[3].markdown("**Fields**")
-
-                        for idx, file_detail in enumerate(demographic_files, 1):
-                            file_path = file_detail['file_path']
-                            unique_fields = []
-                            if file_path in results['demographic_data']:
-                                unique_fields = list(results['demographic_data'][file_path].keys())
-
-                            cols = st.columns([0.5, 2, 1, 2])
-                            cols[0].text(str(idx))
-                            cols[1].text(os.path.basename(file_path))
-                            cols[2].text(str(file_detail['demographic_fields_found']))
-                            cols[3].text(', '.join(unique_fields))
-
-                    # Integration Patterns Summary Table
-                    st.subheader("Integration Patterns Summary")
-                    integration_files = [f for f in results['summary']['file_details'] if f['integration_patterns_found'] > 0]
-                    if integration_files:
-                        cols = st.columns([0.5, 2, 1, 2])
-                        cols[0].markdown("**#**")
-                        cols[1].markdown("**File Name**")
-                        cols[2].markdown("**Patterns Found**")
-                        cols[3].markdown("**Pattern Details**")
-
-                        for idx, file_detail in enumerate(integration_files, 1):
-                            file_path = file_detail['file_path']
-                            pattern_details = set()
-                            for pattern in results['integration_patterns']:
-                                if pattern['file_path'] == file_path:
-                                    pattern_details.add(f"{pattern['pattern_type']}: {pattern['sub_type']}")
-
-                            cols = st.columns([0.5, 2, 1, 2])
-                            cols[0].text(str(idx))
-                            cols[1].text(os.path.basename(file_path))
-                            cols[2].text(str(file_detail['integration_patterns_found']))
-                            cols[3].text(', '.join(pattern_details))
-
-                with tab3:
-                    st.header("Available Reports")
-
-                    # Get all report files and filter by app_name
-                    report_files = [
-                        f for f in os.listdir()
-                        if f.endswith('.html')
-                        and 'CodeLens' in f
-                        and f.startswith(app_name)
-                    ]
-
-                    # Sort files by timestamp in descending order
-                    report_files.sort(key=parse_timestamp_from_filename, reverse=True)
-
-                    if report_files:
-                        # Create a table with five columns
-                        cols = st.columns([1, 3, 2, 2, 2])
-                        cols[0].markdown("**S.No**")
-                        cols[1].markdown("**File Name**")
-                        cols[2].markdown("**Date**")
-                        cols[3].markdown("**Time**")
-                        cols[4].markdown("**Download**")
-
-                        # List all reports
-                        for idx, report_file in enumerate(report_files, 1):
-                            cols = st.columns([1, 3, 2, 2, 2])
-
-                            # Serial number column
-                            cols[0].text(f"{idx}")
-
-                            # File name column without .html extension
-                            display_name = report_file.replace('.html', '')
-                            cols[1].text(display_name)
-
-                            # Extract timestamp and format date and time separately
-                            timestamp = parse_timestamp_from_filename(report_file)
-                            # Date in DD-MMM-YYYY format
-                            cols[2].text(timestamp.strftime('%d-%b-%Y'))
-                            # Time in 12-hour format with AM/PM
-                            cols[3].text(timestamp.strftime('%I:%M:%S %p'))
-
-                            # Download button column (last)
-                            cols[4].markdown(
-                                get_file_download_link(report_file),
-                                unsafe_allow_html=True
-                            )
-                    else:
-                        st.info("No reports available for this application.")
+                # Keep the results across reruns so tab interactions don't re-scan
+                st.session_state['results'] = results
+                st.session_state['file_basenames'] = compute_file_basenames(results)
+                st.session_state['app_name'] = app_name
 
         except Exception as e:
+            st.session_state.pop('results', None)
+            st.session_state.pop('file_basenames', None)
             st.error(f"Error during analysis: {str(e)}")
 
         finally:
             if temp_dir:
-                import shutil
-                shutil.rmtree(temp_dir)
+                remove_in_background(temp_dir)
+
+    if 'results' in st.session_state:
+        # Create tabs for Dashboard, Analysis Results, and Export Reports
+        tab1, tab2, tab3 = st.tabs(["Dashboard", "Analysis Results", "Export Reports"])
+
+        with tab1:
+            render_dashboard_tab()
+
+        with tab2:
+            render_results_tab()
+
+        with tab3:
+            render_reports_tab()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
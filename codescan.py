@@ -1,14 +1,104 @@
 import os  
 import re  
 import json  
-from typing import Dict, List, Set  
+from typing import Dict, Iterable, List, Optional, Set  
 from pathlib import Path  
 import logging  
+from logging.handlers import QueueHandler, QueueListener
+import multiprocessing
+from contextlib import nullcontext
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from importlib.util import find_spec
+from collections import defaultdict
 from dataclasses import dataclass  
 from datetime import datetime
-import pandas as pd
 import math  
 
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator; the combined regex is used without it
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:  # optional accelerator; the integration screen falls back to re
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:  # optional; the standard json module writes the match spill without it
+    orjson = None
+
+# xlsxwriter writes workbooks considerably faster than openpyxl when it is installed
+EXCEL_WRITE_ENGINE = 'xlsxwriter' if find_spec('xlsxwriter') is not None else None
+
+NEWLINE_RE = re.compile('\n')
+WORD_RE = re.compile(r'\w+')
+# A demographic pattern of the form \b(field|field|...)\b
+FIELD_ALTERNATION_RE = re.compile(r'\\b\((.*)\)\\b')
+
+# Repositories smaller than this are scanned in-process; pool start-up would dominate
+PARALLEL_MIN_FILES = 64
+
+# Files with at least this many demographic hits map offsets to lines in one numpy call
+VECTORIZED_LINE_LOOKUP_MIN = 256
+
+# Larger files are bundles or generated artifacts rather than hand-written code
+MAX_CODE_FILE_SIZE = 2 * 1024 * 1024
+# A NUL byte in this many leading bytes marks a file as binary
+BINARY_SNIFF_BYTES = 2048
+
+def _is_word_char(char: str) -> bool:
+    """Return True for characters that \\w matches in a str pattern"""
+    return char.isalnum() or char == '_'
+
+class _WordCharTable(dict):
+    """Character -> is-word-character lookup, filled in on first sight of a character"""
+
+    def __missing__(self, char):
+        self[char] = is_word = _is_word_char(char)
+        return is_word
+
+# Prefilled for Latin-1 so source code boundaries are a single dict lookup
+WORD_CHAR_TABLE = _WordCharTable((chr(i), _is_word_char(chr(i))) for i in range(256))
+
+def _json_default(obj):
+    """Serialize the array columns of demographic occurrences as JSON lists"""
+    if isinstance(obj, array):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _ndjson_line(record: Dict) -> bytes:
+    """Serialize one record as a line of newline-delimited JSON"""
+    if orjson is not None:
+        return orjson.dumps(record, default=_json_default) + b'\n'
+    return json.dumps(record, ensure_ascii=False, default=_json_default).encode('utf-8') + b'\n'
+
+def _read_ndjson(path: str):
+    """Yield the records of a newline-delimited JSON file"""
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(path, 'rb') as f:
+        for line in f:
+            yield loads(line)
+
+_worker_analyzer = None
+
+def _init_worker(analyzer, log_queue, log_level):
+    """Keep one analyzer (with its compiled patterns) per worker process"""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+    # Records go back to the parent's handlers instead of a second log file writer
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(log_level)
+
+def _analyze_in_worker(file_path: str) -> Dict:
+    """Analyze one file with the worker's analyzer"""
+    return _worker_analyzer.analyze_file(file_path)
+
 @dataclass  
 class IntegrationPattern:  
     pattern_type: str  
@@ -21,7 +111,8 @@ class IntegrationPattern:
 class DemographicData:  
     field_name: str  
     data_type: str  
-    occurrences: List[Dict]  
+    line_numbers: array  
+    snippets: List[str]  
 
 class CodeAnalyzer:  
     def __init__(self, repo_path: str, app_name: str):  
@@ -68,6 +159,50 @@ class CodeAnalyzer:
             }
         }
     
+        # Compile every pattern once; analyze_file calls the compiled objects directly
+        self.demographic_patterns = {
+            data_type: re.compile(pattern, re.IGNORECASE)
+            for data_type, pattern in self.demographic_patterns.items()
+        }
+        self.integration_patterns = {
+            pattern_category: {
+                sub_type: re.compile(pattern, re.IGNORECASE)
+                for sub_type, pattern in sub_patterns.items()
+            }
+            for pattern_category, sub_patterns in self.integration_patterns.items()
+        }
+
+        # Single-pass matchers built from the patterns above. For demographic data the
+        # named group that matched (lastgroup) identifies the data type; the integration
+        # union only screens out lines that cannot match any individual sub-pattern.
+        # Demographic fields are recorded in the order they occur in the file, not
+        # grouped by data type, and that order carries through to the reports.
+        self._demographic_combined = re.compile(
+            '|'.join(f'(?P<{data_type}>{pattern.pattern})' for data_type, pattern in self.demographic_patterns.items()),
+            re.IGNORECASE
+        )
+        self._integration_combined = re.compile(
+            '|'.join(
+                f'(?:{pattern.pattern})'
+                for sub_patterns in self.integration_patterns.values()
+                for pattern in sub_patterns.values()
+            ),
+            re.IGNORECASE
+        )
+        # Case-sensitive copy of the union for screening lowercased ASCII text, which is
+        # far cheaper than IGNORECASE. Only valid while no escape is uppercase (\S, \W, ...).
+        self._integration_screen_ascii = (
+            None if re.search(r'\\[A-Z]', self._integration_combined.pattern)
+            else re.compile(self._integration_combined.pattern.lower())
+        )
+
+        self._demographic_automaton = self._build_demographic_automaton()
+        self._integration_database = self._build_integration_database()
+
+        # Bit position of every field name seen so far; files record their fields as a
+        # bitmask that update_results ORs into summary['_field_mask']
+        self._field_id: Dict[str, int] = {}
+
         # Supported file extensions
         self.supported_extensions = {  
             '.py': 'Python',  
@@ -80,6 +215,125 @@ class CodeAnalyzer:
             '.xsd': 'XSD'  
         }  
 
+        # VCS and package-manager directories that are not scanned, at any depth. Names
+        # like build or vendor are left out: they are also ordinary package directories.
+        self.ignored_dirs = {'.git', 'node_modules'}
+
+    def _build_demographic_automaton(self):
+        """
+        Build an Aho-Corasick automaton over the demographic field names, or return
+        None when pyahocorasick is not installed or a pattern is not a plain field list
+        """
+        if ahocorasick is None:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for data_type, pattern in self.demographic_patterns.items():
+            alternation = FIELD_ALTERNATION_RE.fullmatch(pattern.pattern)
+            if not alternation:
+                return None
+            for alternative in alternation.group(1).split('|'):
+                # Expand optional plurals such as gov_ids?
+                words = [alternative[:-2], alternative[:-1]] if alternative.endswith('s?') else [alternative]
+                for word in words:
+                    if not WORD_RE.fullmatch(word):
+                        return None
+                    key = word.lower()
+                    # Like the regex alternation, the first data type listing a field wins
+                    if key not in automaton:
+                        automaton.add_word(key, (data_type, len(key)))
+        automaton.make_automaton()
+        return automaton
+
+    def _build_integration_database(self):
+        """
+        Compile every integration sub-pattern into one Hyperscan database, or return
+        None when python-hyperscan is not installed or rejects a pattern
+        """
+        if hyperscan is None:
+            return None
+
+        database = hyperscan.Database()
+        try:
+            expressions = [
+                pattern.pattern.encode('ascii')
+                for sub_patterns in self.integration_patterns.values()
+                for pattern in sub_patterns.values()
+            ]
+            database.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                elements=len(expressions),
+                flags=[hyperscan.HS_FLAG_CASELESS] * len(expressions)
+            )
+        except (hyperscan.error, UnicodeEncodeError):
+            return None
+        return database
+
+    def __getstate__(self):
+        # Hyperscan databases cannot be pickled; worker processes compile their own.
+        # Results of an earlier scan are not needed by workers.
+        state = self.__dict__.copy()
+        state['_integration_database'] = None
+        state.pop('results', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._integration_database = self._build_integration_database()
+
+    def _iter_integration_candidate_lines(self, content: str, line_starts: List[int]):
+        """
+        Yield, in order, the numbers of the lines on which an integration sub-pattern
+        may match; callers confirm each line against the individual patterns
+        """
+        if self._integration_database is not None and content.isascii():
+            # Hyperscan reports every match end in one pass over the buffer
+            match_ends = []
+            self._integration_database.scan(
+                content.encode('ascii'),
+                match_event_handler=lambda pattern_id, start, end, flags, context: match_ends.append(end)
+            )
+            yield from sorted({bisect_right(line_starts, end - 1) for end in match_ends})
+            return
+
+        # The combined pattern jumps straight to the next line that can match
+        if self._integration_screen_ascii is not None and content.isascii():
+            screen, haystack = self._integration_screen_ascii, content.lower()
+        else:
+            screen, haystack = self._integration_combined, content
+        pos = 0
+        while True:
+            match = screen.search(haystack, pos)
+            if not match:
+                return
+            line_num = bisect_right(line_starts, match.start())
+            yield line_num
+            if line_num >= len(line_starts):
+                return
+            pos = line_starts[line_num]
+
+    def _iter_demographic_matches(self, content: str):
+        """
+        Yield (offset, data_type, field_name) for every demographic field in content
+        """
+        lowered = content.lower() if self._demographic_automaton is not None else None
+        if lowered is None or len(lowered) != len(content):
+            for match in self._demographic_combined.finditer(content):
+                yield match.start(), match.lastgroup, match.group(0)
+            return
+
+        last = len(content) - 1
+        is_word = WORD_CHAR_TABLE
+        for end, (data_type, length) in self._demographic_automaton.iter(lowered):
+            start = end - length + 1
+            # Keep whole-word hits only, mirroring the \b anchors of the patterns
+            if start > 0 and is_word[content[start - 1]]:
+                continue
+            if end < last and is_word[content[end + 1]]:
+                continue
+            yield start, data_type, content[start:end + 1]
+
     def setup_logging(self):  
         logging.basicConfig(  
             level=logging.INFO,  
@@ -91,9 +345,15 @@ class CodeAnalyzer:
         )  
         self.logger = logging.getLogger(__name__)  
 
-    def scan_repository(self) -> Dict:  
+    def scan_repository(self, spill_path: Optional[str] = None, write_report: bool = True) -> Dict:  
         """  
         Main method to scan the repository and analyze code  
+
+        With spill_path, each file's matches are written to that newline-delimited
+        JSON file instead of being kept in the results; only the summary stays in
+        memory and the HTML report is generated by re-reading the file.
+        With write_report=False the summary is completed but no HTML report is
+        written; write_html_report can write one from the results later.
         """  
         results = {
             'metadata': {
@@ -105,40 +365,112 @@ class CodeAnalyzer:
             'integration_patterns': [],
             'summary': {
                 'files_analyzed': 0,
-                'unique_demographic_fields': set(),
+                'unique_demographic_fields': [],
+                '_field_mask': 0,
                 'demographic_fields_found': 0,
                 'integration_patterns_found': 0,
                 'file_details': []
             }  
         }  
 
-        try:  
-            for file_path in self.get_code_files():  
-                self.logger.info(f"Analyzing file: {file_path}")  
-                file_results = self.analyze_file(file_path)  
-                self.update_results(results, file_results, file_path)  
-                results['summary']['files_analyzed'] += 1  
+        if spill_path:
+            results['metadata']['matches_file'] = spill_path
 
-            self.generate_report(results)  
+        try:  
+            with open(spill_path, 'wb') if spill_path else nullcontext() as spill:
+                for file_path, file_results in self.analyze_files(self.get_code_files()):  
+                    self.logger.info(f"Analyzing file: {file_path}")  
+                    self.update_results(results, file_results, file_path, keep_matches=spill is None)  
+                    results['summary']['files_analyzed'] += 1  
+                    if spill is not None:
+                        spill.write(_ndjson_line({
+                            'file_path': str(file_path),
+                            'demographic_data': file_results['demographic_data'].get(str(file_path), {}),
+                            'integration_patterns': file_results['integration_patterns']
+                        }))
+
+            if write_report:
+                self.generate_report(results)
+            else:
+                self._finalize_summary(results)
             return results  
 
         except Exception as e:  
             self.logger.error(f"Error during repository scan: {str(e)}")  
             raise  
 
-    def get_code_files(self) -> List[Path]:  
+    def analyze_files(self, file_paths: List[str]):
+        """
+        Yield (file_path, file_results) in order, analyzing files across CPU cores
+        when there are enough of them to pay for the worker pool
+
+        Workers come from a forkserver, which imports the calling script's __main__
+        module again; scripts that scan at import time must guard the scan with
+        if __name__ == '__main__'. When the pool breaks, for that or any other reason,
+        the files not yet analyzed are analyzed in this process.
+        """
+        if len(file_paths) < PARALLEL_MIN_FILES or (os.cpu_count() or 1) < 2:
+            for file_path in file_paths:
+                yield file_path, self.analyze_file(file_path)
+            return
+
+        # Forking the calling process directly can deadlock when it runs other threads,
+        # as the Streamlit server does
+        context = multiprocessing.get_context('forkserver')
+        log_queue = context.Queue()
+        listener = QueueListener(log_queue, *logging.getLogger().handlers, respect_handler_level=True)
+        listener.start()
+        analyzed = 0
+        try:
+            with ProcessPoolExecutor(
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(self, log_queue, self.logger.getEffectiveLevel())
+            ) as executor:
+                for item in zip(file_paths, executor.map(_analyze_in_worker, file_paths, chunksize=16)):
+                    yield item
+                    analyzed += 1
+        except BrokenProcessPool as e:
+            self.logger.warning(f"Worker pool failed, analyzing remaining files in-process: {str(e)}")
+            for file_path in file_paths[analyzed:]:
+                yield file_path, self.analyze_file(file_path)
+        finally:
+            listener.stop()
+
+    def get_code_files(self) -> List[str]:  
         """  
         Get all supported code files in the repository  
         """  
-        code_files = []  
-        for root, _, files in os.walk(self.repo_path):  
-            for file in files:  
-                file_path = Path(root) / file  
-                if file_path.suffix in self.supported_extensions:  
-                    code_files.append(file_path)  
-        return code_files  
-
-    def analyze_file(self, file_path: Path) -> Dict:  
+        extensions = self.supported_extensions
+        ignored_dirs = self.ignored_dirs
+
+        def scan(directory):
+            # Same order as os.walk: a directory's files first, then its subdirectories
+            subdirectories = []
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            if not entry.is_symlink() and entry.name not in ignored_dirs:
+                                subdirectories.append(entry.path)
+                            continue
+                        dot = entry.name.rfind('.')
+                        if dot > 0 and entry.name[dot:] in extensions:
+                            try:
+                                if entry.stat().st_size > MAX_CODE_FILE_SIZE:
+                                    self.logger.info(f"Skipping file over {MAX_CODE_FILE_SIZE} bytes: {entry.path}")
+                                    continue
+                            except OSError:
+                                continue
+                            yield entry.path
+            except OSError:
+                return
+            for subdirectory in subdirectories:
+                yield from scan(subdirectory)
+
+        return list(scan(str(self.repo_path)))
+
+    def analyze_file(self, file_path: str) -> Dict:  
         """  
         Analyze a single file for demographic data and integration patterns  
         """  
@@ -148,37 +480,72 @@ class CodeAnalyzer:
         }  
 
         try:  
-            with open(file_path, 'r', encoding='utf-8-sig') as f:  
-                content = f.readlines()  
-
-            for line_num, line in enumerate(content, 1):  
-                # Check for demographic data  
-                for data_type, pattern in self.demographic_patterns.items():  
-                    matches = re.finditer(pattern, line, re.IGNORECASE)  
-                    for match in matches:  
-                        field_name = match.group(0)  
-                        if str(file_path) not in results['demographic_data']:  
-                            results['demographic_data'][str(file_path)] = {}  
-                        if field_name not in results['demographic_data'][str(file_path)]:  
-                            results['demographic_data'][str(file_path)][field_name] = {  
-                                'data_type': data_type,  
-                                'occurrences': []  
-                            }  
-                        results['demographic_data'][str(file_path)][field_name]['occurrences'].append({  
-                            'line_number': line_num,  
-                            'code_snippet': line.strip()  
-                        })  
-
-                # Check for integration patterns  
+            # One raw read and one decode; newlines are normalised the way text mode would
+            with open(file_path, 'rb') as f:  
+                data = f.read()
+            if b'\x00' in data[:BINARY_SNIFF_BYTES]:
+                self.logger.info(f"Skipping binary file: {file_path}")
+                return results
+            content = data.decode('utf-8-sig')
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+            # Offset of the first character of every line; the match at offset i
+            # is on line bisect_right(line_starts, i)
+            line_starts = [0]
+            line_starts.extend(match.end() for match in NEWLINE_RE.finditer(content))
+
+            def line_at(line_num):
+                end = line_starts[line_num] if line_num < len(line_starts) else len(content)
+                return content[line_starts[line_num - 1]:end]
+
+            # Each line's snippet is stripped once and shared by all of its matches
+            snippets = {}
+
+            def snippet_at(line_num):
+                snippet = snippets.get(line_num)
+                if snippet is None:
+                    snippet = snippets[line_num] = line_at(line_num).strip()
+                return snippet
+
+            file_key = str(file_path)
+
+            # Check for demographic data  
+            matches = list(self._iter_demographic_matches(content))
+            if len(matches) >= VECTORIZED_LINE_LOOKUP_MIN:
+                import numpy as np
+                offsets = np.fromiter((offset for offset, _, _ in matches), dtype=np.int64, count=len(matches))
+                line_numbers = np.searchsorted(np.asarray(line_starts), offsets, side='right').tolist()
+            else:
+                line_numbers = [bisect_right(line_starts, offset) for offset, _, _ in matches]
+            file_fields = {}
+            for (offset, data_type, field_name), line_num in zip(matches, line_numbers):  
+                field_data = file_fields.get(field_name)
+                if field_data is None:
+                    # Occurrences are kept column-wise: parallel line number and snippet arrays
+                    field_data = file_fields[field_name] = {  
+                        'data_type': data_type,  
+                        'line_numbers': array('i'),
+                        'snippets': []
+                    }  
+                field_data['line_numbers'].append(line_num)
+                field_data['snippets'].append(snippet_at(line_num))
+            if file_fields:
+                results['demographic_data'][file_key] = file_fields
+
+            # Check for integration patterns on candidate lines only, each confirmed
+            # per sub-pattern. A file with no candidate line costs a single screening pass.
+            for line_num in self._iter_integration_candidate_lines(content, line_starts):
+                line = line_at(line_num)
                 for pattern_category, sub_patterns in self.integration_patterns.items():
                     for sub_type, pattern in sub_patterns.items():
-                        if re.search(pattern, line, re.IGNORECASE):
+                        if pattern.search(line):
                             results['integration_patterns'].append({
                                 'pattern_type': pattern_category,
                                 'sub_type': sub_type,
-                                'file_path': str(file_path),
+                                'file_path': file_key,
                                 'line_number': line_num,
-                                'code_snippet': line.strip()
+                                'code_snippet': snippet_at(line_num)
                             })
 
         except Exception as e:  
@@ -186,38 +553,41 @@ class CodeAnalyzer:
 
         return results  
 
-    def update_results(self, main_results: Dict, file_results: Dict, file_path: Path):  
+    def update_results(self, main_results: Dict, file_results: Dict, file_path: str, keep_matches: bool = True):  
         """  
         Update the main results dictionary with results from a single file  
+        (only the summary when keep_matches is False)
         """  
         # Update demographic data  
         demographic_fields_count = 0  
         for file, fields in file_results['demographic_data'].items():  
-            if file not in main_results['demographic_data']:  
-                main_results['demographic_data'][file] = fields  
-            else:  
-                for field_name, data in fields.items():  
-                    if field_name not in main_results['demographic_data'][file]:  
-                        main_results['demographic_data'][file][field_name] = data  
-                    else:  
-                        main_results['demographic_data'][file][field_name]['occurrences'].extend(data['occurrences'])  
-            demographic_fields_count += sum(len(data['occurrences']) for data in fields.values())  
-            main_results['summary']['unique_demographic_fields'].update(fields.keys())  
+            if keep_matches:
+                if file not in main_results['demographic_data']:  
+                    main_results['demographic_data'][file] = fields  
+                else:  
+                    for field_name, data in fields.items():  
+                        if field_name not in main_results['demographic_data'][file]:  
+                            main_results['demographic_data'][file][field_name] = data  
+                        else:  
+                            main_data = main_results['demographic_data'][file][field_name]
+                            main_data['line_numbers'].extend(data['line_numbers'])
+                            main_data['snippets'].extend(data['snippets'])
+            demographic_fields_count += sum(len(data['line_numbers']) for data in fields.values())  
+            field_mask = 0
+            for field_name in fields:
+                field_mask |= 1 << self._field_id.setdefault(field_name, len(self._field_id))
+            main_results['summary']['_field_mask'] |= field_mask
 
         # Update integration patterns  
         integration_patterns_count = len(file_results['integration_patterns'])  
-        main_results['integration_patterns'].extend(  
-            file_results['integration_patterns']  
-        )  
+        if keep_matches:
+            main_results['integration_patterns'].extend(  
+                file_results['integration_patterns']  
+            )  
 
-        # Update summary  
-        main_results['summary']['demographic_fields_found'] = sum(  
-            sum(len(data['occurrences']) for data in fields.values())  
-            for fields in main_results['demographic_data'].values()  
-        )  
-        main_results['summary']['integration_patterns_found'] = len(  
-            main_results['integration_patterns']  
-        )  
+        # Update summary with this file's counts
+        main_results['summary']['demographic_fields_found'] += demographic_fields_count
+        main_results['summary']['integration_patterns_found'] += integration_patterns_count
 
         # Add file details to summary  
         main_results['summary']['file_details'].append({  
@@ -230,6 +600,8 @@ class CodeAnalyzer:
         """
         Analyze Excel file for demographic data based on attr_description
         """
+        import pandas as pd
+
         results = {
             'metadata': {
                 'application_name': self.app_name,
@@ -279,17 +651,26 @@ class CodeAnalyzer:
                 raise ValueError("No 'attr_description' or 'description' column found in the Excel file")
             
             # Extract rows where attr_description contains demographic keywords
-            demographic_data = []
-            for idx, row in df.iterrows():
-                if pd.notna(row[attr_desc_col]):
-                    description = str(row[attr_desc_col]).lower()
-                    # Check if any demographic keyword is present in the description
-                    if any(keyword in description for keyword in demographic_keywords):
-                        record = {}
-                        for col in df.columns:
-                            if pd.notna(row[col]):
-                                record[col] = row[col]
-                        demographic_data.append(record)
+            descriptions = df[attr_desc_col].dropna().astype(str)
+            if ahocorasick is not None:
+                # One pass per description over an automaton of all keywords
+                automaton = ahocorasick.Automaton()
+                for keyword in demographic_keywords:
+                    automaton.add_word(keyword, keyword)
+                automaton.make_automaton()
+                has_keyword = descriptions.str.lower().map(
+                    lambda description: next(automaton.iter(description), None) is not None
+                )
+            else:
+                keyword_pattern = '|'.join(map(re.escape, demographic_keywords))
+                has_keyword = descriptions.str.contains(keyword_pattern, case=False, regex=True, na=False)
+            mask = has_keyword.reindex(df.index, fill_value=False).astype(bool)
+            # NaN and NaT are the only values unequal to themselves, so this drops the
+            # same missing cells as pd.notna without a call per cell
+            demographic_data = [
+                {col: value for col, value in record.items() if value == value and value is not None}
+                for record in df.loc[mask].to_dict('records')
+            ]
             
             results['demographic_data'] = demographic_data
             results['summary']['demographic_fields_found'] = len(demographic_data)
@@ -309,41 +690,78 @@ class CodeAnalyzer:
         """
         Export demographic data to specified number of files
         """
+        import pandas as pd
+
         if not data:
             return
         
         records_per_file = math.ceil(len(data) / num_files)
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
-        for i in range(num_files):
-            start_idx = i * records_per_file
-            end_idx = min((i + 1) * records_per_file, len(data))
-            
-            if start_idx < len(data):
-                chunk_data = data[start_idx:end_idx]
-                df_chunk = pd.DataFrame(chunk_data)
-                
-                filename = f'{self.app_name}_demographic_data_{i+1}_{timestamp}.xlsx'
-                df_chunk.to_excel(filename, index=False)
-                self.logger.info(f"Exported demographic data to: {filename}")
+
+        def write_chunk(i):
+            chunk_data = data[i * records_per_file:(i + 1) * records_per_file]
+            filename = f'{self.app_name}_demographic_data_{i+1}_{timestamp}.xlsx'
+            pd.DataFrame(chunk_data).to_excel(filename, index=False, engine=EXCEL_WRITE_ENGINE)
+            self.logger.info(f"Exported demographic data to: {filename}")
+
+        # The workbooks are independent, so they are written concurrently
+        chunk_indexes = [i for i in range(num_files) if i * records_per_file < len(data)]
+        with ThreadPoolExecutor(max_workers=min(len(chunk_indexes), os.cpu_count() or 1)) as executor:
+            list(executor.map(write_chunk, chunk_indexes))
 
     def generate_report(self, results: Dict):  
         """  
         Generate a detailed HTML report of the analysis  
         """  
-        results['summary']['unique_demographic_fields'] = list(results['summary']['unique_demographic_fields'])  
+        self._finalize_summary(results)
+        self.write_html_report(results)
 
+    def _finalize_summary(self, results: Dict):
+        """
+        Expand the unique-field bitmask kept during the scan into the field list
+        """
+        field_mask = results['summary'].pop('_field_mask', 0)
+        results['summary']['unique_demographic_fields'] = [
+            field_name for field_name, bit in self._field_id.items() if field_mask >> bit & 1
+        ]
+
+    def write_html_report(self, results: Dict) -> str:
+        """
+        Write the HTML report of completed scan results to a timestamped file
+        and return its name
+        """
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')  
         html_report = f'{self.app_name}_CodeLens_{timestamp}.html'  
         self.generate_html_report(results, html_report)  
 
         self.logger.info(f"Analysis report generated: {html_report}")  
+        return html_report
 
     def generate_html_report(self, results: Dict, filename: str):
         """Generate an HTML report for better visualization"""
         self.results = results  # Store results for use in other methods
         unique_fields = list(results['summary']['unique_demographic_fields'])
-        html_content = f"""
+        file_details = results['summary']['file_details']
+
+        # Every section iterates the matches afresh, from memory or from the spill file
+        spill_path = results['metadata'].get('matches_file')
+        if spill_path:
+            def demographic_items():
+                return ((record['file_path'], record['demographic_data'])
+                        for record in _read_ndjson(spill_path) if record['demographic_data'])
+
+            def integration_patterns():
+                return (pattern for record in _read_ndjson(spill_path) for pattern in record['integration_patterns'])
+        else:
+            demographic_items = results['demographic_data'].items
+
+            def integration_patterns():
+                return results['integration_patterns']
+
+        fields_by_file = {file_path: list(fields) for file_path, fields in demographic_items()}
+
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(f"""
         <!DOCTYPE html>
         <html>
         <head>
@@ -375,37 +793,41 @@ class CodeAnalyzer:
                 <p>Demographic Fields Occurrences Found: {results['summary']['demographic_fields_found']}</p>
                 <p>Integration Patterns Found: {results['summary']['integration_patterns_found']}</p>
 
-                {self._generate_field_frequency_html(results)}
-
-                {self._generate_demographic_summary_html(results['summary']['file_details'])}
-                {self._generate_integration_summary_html(results['summary']['file_details'])}
+                """)
+            self._write_field_frequency_html(f, (fields for _, fields in demographic_items()))
+            f.write("\n\n                ")
+            self._write_demographic_summary_html(f, file_details, fields_by_file)
+            f.write("\n                ")
+            self._write_integration_summary_html(f, file_details, integration_patterns())
+            f.write("""
             </div>
 
             <div class="section">
                 <h2>Demographic Data Fields by File</h2>
-                {self._generate_demographic_html(results['demographic_data'])}
+                """)
+            self._write_demographic_html(f, demographic_items())
+            f.write("""
             </div>
 
             <div class="section">
                 <h2>Integration Patterns</h2>
-                {self._generate_integration_html(results['integration_patterns'])}
+                """)
+            self._write_integration_html(f, integration_patterns())
+            f.write("""
             </div>
         </body>
         </html>
-        """
-
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        """)
 
-    def _generate_demographic_summary_html(self, file_details: List[Dict]) -> str:
-        """Generate HTML table for demographic field summary"""
+    def _write_demographic_summary_html(self, out, file_details: List[Dict], fields_by_file: Dict[str, List[str]]) -> None:
+        """Write HTML table for demographic field summary to out"""
         # Filter out entries with zero demographic fields
         demographic_files = [f for f in file_details if f['demographic_fields_found'] > 0]
 
         if not demographic_files:
-            return ""
+            return
 
-        html = """
+        out.write("""
         <h3>Demographic Fields Summary</h3>
         <table>
             <tr>
@@ -414,34 +836,34 @@ class CodeAnalyzer:
                 <th>Demographic Fields Occurrences</th>
                 <th>Fields</th>
             </tr>
-        """
+        """)
 
         for index, file_detail in enumerate(demographic_files, 1):
             # Get unique fields for this file from demographic_data
             file_path = file_detail['file_path']
             unique_fields = []
-            if file_path in self.results['demographic_data']:
-                unique_fields = list(self.results['demographic_data'][file_path].keys())
+            if file_path in fields_by_file:
+                unique_fields = fields_by_file[file_path]
 
-            html += f"""
+            out.write(f"""
             <tr>
                 <td>{index}</td>
                 <td>{file_path}</td>
                 <td>{file_detail['demographic_fields_found']}</td>
                 <td>{', '.join(unique_fields)}</td>
             </tr>
-            """
-        return html + "</table>"
+            """)
+        out.write("</table>")
 
-    def _generate_integration_summary_html(self, file_details: List[Dict]) -> str:
-        """Generate HTML table for integration patterns summary"""
+    def _write_integration_summary_html(self, out, file_details: List[Dict], integration_patterns: Iterable[Dict]) -> None:
+        """Write HTML table for integration patterns summary to out"""
         # Filter out entries with zero integration patterns
         integration_files = [f for f in file_details if f['integration_patterns_found'] > 0]
 
         if not integration_files:
-            return ""
+            return
 
-        html = """
+        out.write("""
         <h3>Integration Patterns Summary</h3>
         <table>
             <tr>
@@ -450,48 +872,46 @@ class CodeAnalyzer:
                 <th>Integration Patterns Found</th>
                 <th>Patterns Found Details</th>
             </tr>
-        """
+        """)
+
+        # Group pattern details by file in a single pass
+        patterns_by_file = defaultdict(set)
+        for pattern in integration_patterns:
+            patterns_by_file[pattern['file_path']].add(f"{pattern['pattern_type']}: {pattern['sub_type']}")
 
         for index, file_detail in enumerate(integration_files, 1):
             # Get pattern details for this file
-            file_path = file_detail['file_path']
-            pattern_details = set()
-            for pattern in self.results['integration_patterns']:
-                if pattern['file_path'] == file_path:
-                    pattern_details.add(f"{pattern['pattern_type']}: {pattern['sub_type']}")
+            pattern_details = patterns_by_file[file_detail['file_path']]
 
-            html += f"""
+            out.write(f"""
             <tr>
                 <td>{index}</td>
                 <td>{file_detail['file_path']}</td>
                 <td>{file_detail['integration_patterns_found']}</td>
                 <td>{', '.join(pattern_details)}</td>
             </tr>
-            """
-        return html + "</table>"
+            """)
+        out.write("</table>")
 
-    def _generate_demographic_html(self, demographic_data: Dict) -> str:  
-        html = ""  
-        for file_path, fields in demographic_data.items():  
-            html += f"<h3>File: {file_path}</h3>"  
+    def _write_demographic_html(self, out, demographic_items: Iterable) -> None:  
+        for file_path, fields in demographic_items:  
+            out.write(f"<h3>File: {file_path}</h3>")
             for field_name, data in fields.items():  
-                html += f"""  
+                out.write(f"""  
                 <div class="pattern">  
                     <h4>Field: {field_name} (Type: {data['data_type']})</h4>  
-                    """  
-                for occurrence in data['occurrences']:  
-                    html += f"""  
+                    """)
+                for line_number, code_snippet in zip(data['line_numbers'], data['snippets']):  
+                    out.write(f"""  
                     <div class="code">  
-                        <p>Line {occurrence['line_number']}: {occurrence['code_snippet']}</p>  
+                        <p>Line {line_number}: {code_snippet}</p>  
                     </div>  
-                    """  
-                html += "</div>"  
-        return html  
+                    """)
+                out.write("</div>")
 
-    def _generate_integration_html(self, integration_patterns: List) -> str:  
-        html = ""  
+    def _write_integration_html(self, out, integration_patterns: Iterable[Dict]) -> None:  
         for pattern in integration_patterns:  
-            html += f"""  
+            out.write(f"""  
             <div class="pattern">
                 <h3>Pattern Type: {pattern['pattern_type']}</h3>
                 <p>Sub Type: {pattern['sub_type']}</p>
@@ -501,25 +921,24 @@ class CodeAnalyzer:
                     <p>{pattern['code_snippet']}</p>
                 </div>
             </div>
-            """  
-        return html  
+            """)
 
-    def _generate_field_frequency_html(self, results: Dict) -> str:
-        """Generate HTML table for field frequency"""
+    def _write_field_frequency_html(self, out, file_fields: Iterable[Dict]) -> None:
+        """Write HTML table for field frequency to out"""
         # Calculate field frequencies
         field_frequencies = {}
-        for file_data in results['demographic_data'].values():
+        for file_data in file_fields:
             for field_name, data in file_data.items():
                 if field_name not in field_frequencies:
                     field_frequencies[field_name] = {
-                        'count': len(data['occurrences']),
+                        'count': len(data['line_numbers']),
                         'type': data['data_type']
                     }
                 else:
-                    field_frequencies[field_name]['count'] += len(data['occurrences'])
+                    field_frequencies[field_name]['count'] += len(data['line_numbers'])
 
         # Generate HTML table with consistent styling
-        html = """
+        out.write("""
         <div class="section">
             <h3>Field Frequency Analysis</h3>
             <p>Below table shows how many times each demographic field appears across all analyzed files:</p>
@@ -530,24 +949,23 @@ class CodeAnalyzer:
                     <th style="width: 30%;">Field Type</th>
                     <th style="width: 30%;">Total Occurrences</th>
                 </tr>
-        """
+        """)
 
         for idx, (field_name, data) in enumerate(sorted(field_frequencies.items(), key=lambda x: x[1]['count'], reverse=True), 1):
-            html += f"""
+            out.write(f"""
                 <tr>
                     <td>{idx}</td>
                     <td>{field_name}</td>
                     <td>{data['type']}</td>
                     <td>{data['count']}</td>
                 </tr>
-            """
+            """)
 
-        html += """
+        out.write("""
             </table>
         </div>
         <br>
-        """
-        return html
+        """)
 
 def main():  
     """
@@ -558,7 +976,9 @@ def main():
     
     try:
         analyzer = CodeAnalyzer(repo_path, app_name)  
-        results = analyzer.scan_repository()  
+        # Keep only the summary in memory; matches go to an ndjson file next to the report
+        spill_path = f"{app_name}_CodeLens_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson"
+        results = analyzer.scan_repository(spill_path=spill_path)  
         print(f"Analysis complete. Check the generated reports for details.")  
     except Exception as e:
        print(f"Error during analysis: {str(e)}")
@@ -568,4 +988,5 @@ if __name__ == "__main__":
 
 # Created/Modified files during execution:  
 # - code_analysis.log  
-# - code_analysis_report_[timestamp].html
\ No newline at end of file
+# - code_analysis_report_[timestamp].html
+# - <app>_CodeLens_[timestamp].ndjson (matches, when run from the command line)
\ No newline at end of file
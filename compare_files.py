@@ -1,178 +1,154 @@
 import sys
+from html import escape
 from pathlib import Path
 from datetime import datetime
+from itertools import chain
 
 
-def find_duplicates_within_file(filepath):
-    """Find duplicate entries within a single file."""
-    seen = {}
-    duplicates = []
-    
-    with open(filepath, 'r') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if line:
-                if line in seen:
-                    duplicates.append((line, seen[line], line_num))
-                else:
-                    seen[line] = line_num
-    
-    return duplicates
-
-
-def find_duplicates_between_files(file1, file2):
-    """Find entries that appear in both files."""
-    entries1 = {}
-    entries2 = {}
-    
-    with open(file1, 'r') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if line:
-                if line not in entries1:
-                    entries1[line] = []
-                entries1[line].append(line_num)
-    
-    with open(file2, 'r') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if line:
-                if line not in entries2:
-                    entries2[line] = []
-                entries2[line].append(line_num)
-    
-    common_entries = set(entries1.keys()) & set(entries2.keys())
-    duplicates = []
-    for entry in common_entries:
-        duplicates.append((entry, entries1[entry], entries2[entry]))
-    
-    return duplicates
+# Files are read and split in blocks of this size rather than line by line
+READ_BLOCK_SIZE = 16 * 1024 * 1024
 
+# Report table markup, formatted once per row instead of re-parsing an f-string
+DUPLICATES_TABLE_OPEN = '''            <table>
+                <thead>
+                    <tr>
+                        <th>Original Line</th>
+                        <th>Duplicate Line</th>
+                        <th>Entry Data</th>
+                    </tr>
+                </thead>
+                <tbody>
+'''
+ROW_TEMPLATE = '''                    <tr>
+                        <td>{0}</td>
+                        <td>{1}</td>
+                        <td><div class="entry-data">{2}</div></td>
+                    </tr>
+'''
+TABLE_CLOSE = '''                </tbody>
+            </table>
+'''
 
-def generate_html_report(file1, file2, dups1, dups2, common):
-    """Generate an HTML report with tables."""
-    total_issues = len(dups1) + len(dups2) + len(common)
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    
-    html = f'''<!DOCTYPE html>
+# Report markup is built once at import; each report only formats the few values it needs
+REPORT_HEAD = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>File Comparison Report</title>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
-        body {{
+        }
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
             padding: 40px 20px;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
-        }}
-        .header {{
+        }
+        .header {
             background: white;
             border-radius: 16px;
             padding: 30px;
             margin-bottom: 30px;
             box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             color: #333;
             font-size: 2rem;
             margin-bottom: 10px;
-        }}
-        .header .meta {{
+        }
+        .header .meta {
             color: #666;
             font-size: 0.9rem;
-        }}
-        .summary-cards {{
+        }
+        .summary-cards {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             margin-bottom: 30px;
-        }}
-        .card {{
+        }
+        .card {
             background: white;
             border-radius: 12px;
             padding: 25px;
             text-align: center;
             box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-        }}
-        .card .number {{
+        }
+        .card .number {
             font-size: 3rem;
             font-weight: bold;
             color: #667eea;
-        }}
-        .card .label {{
+        }
+        .card .label {
             color: #666;
             font-size: 0.9rem;
             margin-top: 5px;
-        }}
-        .card.warning .number {{
+        }
+        .card.warning .number {
             color: #f59e0b;
-        }}
-        .card.danger .number {{
+        }
+        .card.danger .number {
             color: #ef4444;
-        }}
-        .card.success .number {{
+        }
+        .card.success .number {
             color: #10b981;
-        }}
-        .section {{
+        }
+        .section {
             background: white;
             border-radius: 16px;
             padding: 30px;
             margin-bottom: 30px;
             box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-        }}
-        .section h2 {{
+        }
+        .section h2 {
             color: #333;
             font-size: 1.4rem;
             margin-bottom: 20px;
             padding-bottom: 10px;
             border-bottom: 2px solid #667eea;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 15px;
-        }}
-        th {{
+        }
+        th {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 15px;
             text-align: left;
             font-weight: 600;
-        }}
-        td {{
+        }
+        td {
             padding: 12px 15px;
             border-bottom: 1px solid #eee;
             color: #444;
-        }}
-        tr:hover {{
+        }
+        tr:hover {
             background: #f8f9ff;
-        }}
-        .no-data {{
+        }
+        .no-data {
             text-align: center;
             padding: 30px;
             color: #10b981;
             font-size: 1.1rem;
-        }}
-        .entry-data {{
+        }
+        .entry-data {
             font-family: 'Courier New', monospace;
             font-size: 0.85rem;
             background: #f5f5f5;
             padding: 8px 12px;
             border-radius: 6px;
             word-break: break-all;
-        }}
-        .file-info {{
+        }
+        .file-info {
             display: inline-block;
             background: #667eea;
             color: white;
@@ -180,11 +156,12 @@ def generate_html_report(file1, file2, dups1, dups2, common):
             border-radius: 20px;
             font-size: 0.8rem;
             margin: 2px;
-        }}
+        }
     </style>
 </head>
 <body>
-    <div class="container">
+'''
+REPORT_HEADER_TEMPLATE = '''    <div class="container">
         <div class="header">
             <h1>File Comparison Report</h1>
             <p class="meta">Generated: {timestamp}</p>
@@ -193,122 +170,178 @@ def generate_html_report(file1, file2, dups1, dups2, common):
         </div>
         
         <div class="summary-cards">
-            <div class="card {'success' if len(dups1) == 0 else 'warning'}">
-                <div class="number">{len(dups1)}</div>
-                <div class="label">Duplicates in File 1</div>
-            </div>
-            <div class="card {'success' if len(dups2) == 0 else 'warning'}">
-                <div class="number">{len(dups2)}</div>
-                <div class="label">Duplicates in File 2</div>
-            </div>
-            <div class="card {'success' if len(common) == 0 else 'danger'}">
-                <div class="number">{len(common)}</div>
-                <div class="label">Common Entries</div>
-            </div>
-            <div class="card {'success' if total_issues == 0 else 'danger'}">
-                <div class="number">{total_issues}</div>
-                <div class="label">Total Issues</div>
+'''
+CARD_TEMPLATE = '''            <div class="card {0}">
+                <div class="number">{1}</div>
+                <div class="label">{2}</div>
             </div>
-        </div>
+'''
+CARDS_CLOSE = '''        </div>
         
-        <div class="section">
-            <h2>Duplicates within {file1.name}</h2>
 '''
-    
-    if dups1:
-        html += '''            <table>
+SECTION_OPEN_TEMPLATE = '''        <div class="section">
+            <h2>{0}</h2>
+'''
+SECTION_CLOSE = '''        </div>
+        
+'''
+COMMON_TABLE_OPEN_TEMPLATE = '''            <table>
                 <thead>
                     <tr>
-                        <th>Original Line</th>
-                        <th>Duplicate Line</th>
+                        <th>Lines in {0}</th>
+                        <th>Lines in {1}</th>
                         <th>Entry Data</th>
                     </tr>
                 </thead>
                 <tbody>
 '''
-        for entry, first_line, dup_line in dups1:
-            html += f'''                    <tr>
-                        <td>{first_line}</td>
-                        <td>{dup_line}</td>
-                        <td><div class="entry-data">{entry}</div></td>
-                    </tr>
+NO_DUPLICATES = '''            <div class="no-data">No duplicates found</div>
 '''
-        html += '''                </tbody>
-            </table>
+NO_COMMON_ENTRIES = '''            <div class="no-data">No common entries found between files</div>
 '''
-    else:
-        html += '''            <div class="no-data">No duplicates found</div>
+REPORT_FOOTER = '''        </div>
+    </div>
+</body>
+</html>
 '''
+
+
+def read_line_blocks(filepath, block_size=READ_BLOCK_SIZE):
+    """Yield the raw lines of a binary file as lists, one list per block read."""
+    # The blocks are already large reads, so an extra layer of buffering would only copy them
+    with open(filepath, 'rb', buffering=0) as f:
+        partial = b''
+        while True:
+            block = f.read(block_size)
+            if not block:
+                if partial:
+                    yield [partial]
+                return
+            lines = (partial + block).split(b'\n')
+            # The last piece may continue in the next block
+            partial = lines.pop()
+            yield lines
+
+
+def numbered_lines(filepath):
+    """Iterate (line_number, raw_line) over a file, splitting it in C a block at a time."""
+    return enumerate(chain.from_iterable(read_line_blocks(filepath)), 1)
+
+
+def scan_file(filepath):
+    """Read a file once, returning its duplicates and each entry's first line number."""
+    first_lines = {}
+    duplicates = []
     
-    html += f'''        </div>
-        
-        <div class="section">
-            <h2>Duplicates within {file2.name}</h2>
-'''
+    # Most lines are unique, so a line costs one setdefault unless it repeats;
+    # the later line numbers of a repeated entry are recorded by its duplicates
+    first_seen = first_lines.setdefault
+    add_duplicate = duplicates.append
+    for line_num, line in numbered_lines(filepath):
+        line = line.strip()
+        if not line:
+            continue
+        first_line = first_seen(line, line_num)
+        if first_line != line_num:
+            add_duplicate((line, first_line, line_num))
+    
+    return duplicates, first_lines
+
+
+def collect_line_numbers(entries, first_lines, duplicates):
+    """Map each of entries to all of its line numbers, from scan_file's results."""
+    line_numbers = {entry: [first_lines[entry]] for entry in entries}
+    lines_of = line_numbers.get
+    for entry, _, line_num in duplicates:
+        entry_lines = lines_of(entry)
+        if entry_lines is not None:
+            entry_lines.append(line_num)
+    return line_numbers
+
+
+def find_common_entries(first_lines1, dups1, first_lines2, dups2):
+    """Find entries present in both files, given the two files' scan_file results."""
+    # Walk the smaller map and probe the larger one
+    if len(first_lines1) <= len(first_lines2):
+        smaller, larger = first_lines1, first_lines2
+    else:
+        smaller, larger = first_lines2, first_lines1
+    common = [entry for entry in smaller if entry in larger]
+    lines1 = collect_line_numbers(common, first_lines1, dups1)
+    lines2 = collect_line_numbers(common, first_lines2, dups2)
+    
+    return [(entry, lines1[entry], lines2[entry]) for entry in common]
+
+
+def find_duplicates_within_file(filepath):
+    """Find duplicate entries within a single file."""
+    return scan_file(filepath)[0]
+
+
+def find_duplicates_between_files(file1, file2):
+    """Find entries that appear in both files."""
+    dups1, first_lines1 = scan_file(file1)
+    dups2, first_lines2 = scan_file(file2)
+    return find_common_entries(first_lines1, dups1, first_lines2, dups2)
+
+
+def write_html_report(out, file1, file2, dups1, dups2, common):
+    """Write an HTML report with tables to the writable text file out."""
+    total_issues = len(dups1) + len(dups2) + len(common)
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    file1_path = escape(str(file1))
+    file2_path = escape(str(file2))
+    file1_name = escape(file1.name)
+    file2_name = escape(file2.name)
+    
+    add = out.write
+    row = ROW_TEMPLATE.format
+    card = CARD_TEMPLATE.format
+    
+    add(REPORT_HEAD)
+    add(REPORT_HEADER_TEMPLATE.format(timestamp=timestamp, file1=file1_path, file2=file2_path))
+    add(card('warning' if dups1 else 'success', len(dups1), 'Duplicates in File 1'))
+    add(card('warning' if dups2 else 'success', len(dups2), 'Duplicates in File 2'))
+    add(card('danger' if common else 'success', len(common), 'Common Entries'))
+    add(card('danger' if total_issues else 'success', total_issues, 'Total Issues'))
+    add(CARDS_CLOSE)
+    add(SECTION_OPEN_TEMPLATE.format(f'Duplicates within {file1_name}'))
+    
+    def render(entry):
+        # Entries are bytes; only the ones written to the report are decoded
+        return escape(entry.decode('utf-8', 'replace'))
+    
+    if dups1:
+        add(DUPLICATES_TABLE_OPEN)
+        for entry, first_line, dup_line in dups1:
+            add(row(first_line, dup_line, render(entry)))
+        add(TABLE_CLOSE)
+    else:
+        add(NO_DUPLICATES)
+    
+    add(SECTION_CLOSE)
+    add(SECTION_OPEN_TEMPLATE.format(f'Duplicates within {file2_name}'))
     
     if dups2:
-        html += '''            <table>
-                <thead>
-                    <tr>
-                        <th>Original Line</th>
-                        <th>Duplicate Line</th>
-                        <th>Entry Data</th>
-                    </tr>
-                </thead>
-                <tbody>
-'''
+        add(DUPLICATES_TABLE_OPEN)
         for entry, first_line, dup_line in dups2:
-            html += f'''                    <tr>
-                        <td>{first_line}</td>
-                        <td>{dup_line}</td>
-                        <td><div class="entry-data">{entry}</div></td>
-                    </tr>
-'''
-        html += '''                </tbody>
-            </table>
-'''
+            add(row(first_line, dup_line, render(entry)))
+        add(TABLE_CLOSE)
     else:
-        html += '''            <div class="no-data">No duplicates found</div>
-'''
+        add(NO_DUPLICATES)
     
-    html += '''        </div>
-        
-        <div class="section">
-            <h2>Entries Appearing in Both Files</h2>
-'''
+    add(SECTION_CLOSE)
+    add(SECTION_OPEN_TEMPLATE.format('Entries Appearing in Both Files'))
     
     if common:
-        html += f'''            <table>
-                <thead>
-                    <tr>
-                        <th>Lines in {file1.name}</th>
-                        <th>Lines in {file2.name}</th>
-                        <th>Entry Data</th>
-                    </tr>
-                </thead>
-                <tbody>
-'''
+        add(COMMON_TABLE_OPEN_TEMPLATE.format(file1_name, file2_name))
         for entry, lines1, lines2 in common:
-            html += f'''                    <tr>
-                        <td>{', '.join(map(str, lines1))}</td>
-                        <td>{', '.join(map(str, lines2))}</td>
-                        <td><div class="entry-data">{entry}</div></td>
-                    </tr>
-'''
-        html += '''                </tbody>
-            </table>
-'''
+            add(row(', '.join(map(str, lines1)), ', '.join(map(str, lines2)), render(entry)))
+        add(TABLE_CLOSE)
     else:
-        html += '''            <div class="no-data">No common entries found between files</div>
-'''
+        add(NO_COMMON_ENTRIES)
     
-    html += '''        </div>
-    </div>
-</body>
-</html>
-'''
-    
-    return html
+    add(REPORT_FOOTER)
 
 
 def main():
@@ -333,14 +366,14 @@ def main():
         print(f"Error: File '{file2}' not found.")
         sys.exit(1)
     
-    dups1 = find_duplicates_within_file(file1)
-    dups2 = find_duplicates_within_file(file2)
-    common = find_duplicates_between_files(file1, file2)
-    
-    html_report = generate_html_report(file1, file2, dups1, dups2, common)
+    # One read per file yields both its duplicates and the map used for common entries
+    dups1, first_lines1 = scan_file(file1)
+    dups2, first_lines2 = scan_file(file2)
+    common = find_common_entries(first_lines1, dups1, first_lines2, dups2)
     
-    with open(output_file, 'w') as f:
-        f.write(html_report)
+    # Rows go straight to the file through a 1 MiB buffer; the report is never held whole
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        write_html_report(f, file1, file2, dups1, dups2, common)
     
     total_issues = len(dups1) + len(dups2) + len(common)
     print(f"Comparison complete!")